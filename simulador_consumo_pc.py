@@ -1,9 +1,53 @@
+import array
 import os
-import matplotlib.pyplot as plt # Importa a biblioteca para gráficos
+import sys
+import threading
+from functools import lru_cache
+import numpy as np # Importa a biblioteca para cálculo vetorizado
+
+try:
+    from numba import njit # Compilação JIT opcional do kernel de cálculo
+except ImportError:
+    njit = None
 
 # --- Constantes ---
 PRECO_KWH = 0.80  # Preço do kWh em R$/kWh. Definido como constante em maiúsculas.
 
+# Modelo de formatação do cabeçalho da tabela comparativa, vinculado uma
+# única vez na importação
+_CABECALHO_TABELA = "{:<20} {:<15} {:<15} {:<15}".format
+
+# Larguras das colunas da tabela comparativa
+_LARGURAS_TABELA = (20, 15, 15, 15)
+
+_formatadores_linha = {}
+
+def _formatador_linha(larguras=_LARGURAS_TABELA):
+    """
+    Gera (e memoiza por tupla de larguras) a função que formata uma linha da
+    tabela. A f-string é compilada via exec com as larguras embutidas como
+    literais, de modo que viram constantes no bytecode do formatador.
+    """
+    fmt = _formatadores_linha.get(larguras)
+    if fmt is None:
+        ln, lp, lk, lc = larguras
+        src = (
+            "def _fmt(n, p, k, c):\n"
+            f'    return f"{{n:<{ln}}} {{p:<{lp}d}} {{k:<{lk}.2f}} {{c:<{lc}.2f}}"\n'
+        )
+        ns = {}
+        exec(src, ns)
+        fmt = _formatadores_linha[larguras] = ns["_fmt"]
+    return fmt
+
+# Respostas aceitas na confirmação de continuar; frozenset dá teste de
+# pertencimento com hash em vez de varredura de lista alocada a cada volta
+_SIM_NAO = frozenset(("s", "n"))
+
+# Atalho para escrever telas inteiras de uma vez, sem o flush implícito
+# que o print faz a cada chamada
+_out = sys.stdout.write
+
 # --- Funções de Validação e Entrada ---
 def get_int_input(prompt, min_val, max_val):
     """
@@ -19,13 +63,17 @@ def get_int_input(prompt, min_val, max_val):
         int: O valor inteiro válido inserido pelo usuário.
     """
     while True:
-        try:
-            value = int(input(prompt))
+        texto = input(prompt).strip()
+        # Valida os dígitos em C antes de converter, evitando o caminho de
+        # exceção do int() para erros de digitação comuns. O isascii() é
+        # necessário porque isdigit() também aceita dígitos Unicode (ex.: '²')
+        # que o int() rejeita
+        if texto.isascii() and texto.isdigit():
+            value = int(texto, 10)
             if min_val <= value <= max_val:
                 return value
-            else:
-                print(f"Ops! O valor precisa estar entre {min_val} e {max_val}. Tente novamente.")
-        except ValueError:
+            print(f"Ops! O valor precisa estar entre {min_val} e {max_val}. Tente novamente.")
+        else:
             print("Entrada inválida. Por favor, digite apenas números inteiros.")
 
 def get_validated_string_input(prompt, validator_func, error_message):
@@ -48,110 +96,241 @@ def get_validated_string_input(prompt, validator_func, error_message):
         else:
             print(error_message)
 
-def valida_nome_computador(nome):
+def valida_nome_computador(nome, _len=len):
     """
     Valida o comprimento do nome do computador.
     Retorna True se o nome for válido, False caso contrário.
+
+    O argumento padrão _len=len liga o builtin como variável local,
+    evitando a busca no escopo global a cada chamada do validador.
     """
-    return 3 <= len(nome) <= 20
+    return 3 <= _len(nome) <= 20
 
 # --- Funções de Cálculo ---
-def calcular_consumo_mensal(potencia, horas_por_dia, dias_por_mes, preco_kwh):
+def _consumo_kernel(potencias, horas_por_dia, dias_por_mes):
     """
-    Calcula o consumo mensal de energia em kWh e o custo mensal em Reais.
+    Kernel de cálculo do consumo mensal em kWh: um laço simples que o Numba
+    compila para código nativo. Mantido separado de calcular_consumo_mensal
+    para que a versão sem Numba continue usando o caminho vetorizado do NumPy.
+    """
+    n = potencias.shape[0]
+    consumo = np.empty(n, dtype=np.float32)
+    for i in range(n):
+        consumo[i] = potencias[i] * horas_por_dia[i] * dias_por_mes[i] * (1.0 / 1000.0)
+    return consumo
+
+if njit is not None:
+    # cache=True grava o código compilado em disco, evitando recompilar a cada execução
+    _consumo_kernel = njit(cache=True, fastmath=True)(_consumo_kernel)
+
+def calcular_consumo_mensal(potencias, horas_por_dia, dias_por_mes, preco_kwh):
+    """
+    Calcula o consumo mensal de energia em kWh e o custo mensal em Reais
+    para todos os computadores de uma só vez, usando arrays NumPy.
 
     Args:
-        potencia (int): A potência do computador em Watts.
-        horas_por_dia (int): O número de horas por dia que o computador fica ligado.
-        dias_por_mes (int): O número de dias por mês que o computador fica ligado.
+        potencias (np.ndarray): As potências dos computadores em Watts.
+        horas_por_dia (np.ndarray): Horas por dia que cada computador fica ligado.
+        dias_por_mes (np.ndarray): Dias por mês que cada computador fica ligado.
         preco_kwh (float): O preço do quilowatt-hora (kWh).
 
     Returns:
-        tuple: Uma tupla contendo (consumo_mensal_kwh, custo_mensal).
+        tuple: Uma tupla de arrays contendo (consumo_mensal_kwh, custo_mensal).
     """
-    consumo_mensal_kwh = (potencia * horas_por_dia * dias_por_mes) / 1000
+    if njit is not None:
+        consumo_mensal_kwh = _consumo_kernel(potencias, horas_por_dia, dias_por_mes)
+    else:
+        consumo_mensal_kwh = (potencias.astype(np.float32) * horas_por_dia * dias_por_mes) * (1.0 / 1000.0)
     custo_mensal = consumo_mensal_kwh * preco_kwh
     return consumo_mensal_kwh, custo_mensal
 
+@lru_cache(maxsize=None)
+def calcular_consumo_unitario(potencia, horas_por_dia, dias_por_mes):
+    """
+    Versão escalar e memoizada do cálculo, com o preço padrão PRECO_KWH
+    embutido. Útil para quem reutiliza este módulo em varreduras de
+    parâmetros: repetir a mesma tripla (W, h/dia, dias/mês) vira uma
+    consulta de cache em vez de refazer a aritmética.
+
+    Returns:
+        tuple: Uma tupla contendo (consumo_mensal_kwh, custo_mensal).
+    """
+    consumo_mensal_kwh = (potencia * horas_por_dia * dias_por_mes) / 1000
+    return consumo_mensal_kwh, consumo_mensal_kwh * PRECO_KWH
+
 # --- Funções Utilitárias ---
+if os.name == 'nt':
+    # Habilita o processamento de sequências ANSI no console do Windows 10+
+    import ctypes
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.SetConsoleMode(_kernel32.GetStdHandle(-11), 7)
+
+# Constantes de limpeza de tela, resolvidas uma única vez na importação
+_CLEAR_SEQ = "\x1b[2J\x1b[H" # Sequência ANSI: apaga a tela e volta o cursor ao topo
+_CLEAR_CMD = 'cls' if os.name == 'nt' else 'clear' # Fallback quando stdout não é um terminal
+
 def limpa_tela():
     """Limpa a tela do console."""
-    comando = 'cls' if os.name == 'nt' else 'clear'
-    os.system(comando)
+    if sys.stdout.isatty():
+        # Sequência ANSI, sem criar subprocesso
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+    else:
+        os.system(_CLEAR_CMD)
 
-def exibir_resultados_individuais(computadores):
+def exibir_resultados_individuais(nomes, potencias, consumos_kwh, custos):
     """Exibe os detalhes do consumo de energia para cada computador inserido."""
     limpa_tela()
-    print("--- Detalhes Individuais dos Computadores ---\n")
-    if not computadores:
+    if len(nomes) == 0:
+        print("--- Detalhes Individuais dos Computadores ---\n")
         print("Nenhum computador foi adicionado ainda.")
         return
 
-    for comp in computadores:
-        print(f"Nome do Computador: {comp['nome']}")
-        print(f"Potência configurada: {comp['potencia']} W")
-        print(f"Consumo mensal estimado: {comp['consumo_kwh']:.2f} kWh")
-        print(f"Custo mensal estimado: R${comp['custo']:.2f}\n")
+    # Um único bloco de f-string por computador (tudo em locais desempacotados
+    # pelo zip), escrito de uma só vez para a tela inteira
+    blocos = [
+        f"Nome do Computador: {nome}\n"
+        f"Potência configurada: {potencia} W\n"
+        f"Consumo mensal estimado: {consumo_kwh:.2f} kWh\n"
+        f"Custo mensal estimado: R${custo:.2f}\n"
+        for nome, potencia, consumo_kwh, custo in zip(nomes, potencias, consumos_kwh, custos)
+    ]
+    _out("--- Detalhes Individuais dos Computadores ---\n\n" + "\n".join(blocos))
     input("\nPressione Enter para continuar e ver a comparação...") # Pausa para o usuário ler
 
-def exibir_comparacao_tabela(computadores):
+def exibir_comparacao_tabela(nomes, potencias, consumos_kwh, custos):
     """Exibe uma comparação de consumo e custo entre os computadores inseridos em formato de tabela."""
     limpa_tela()
-    print("--- Comparativo de Consumo de Energia (Tabela) ---\n")
 
-    if not computadores:
+    if len(nomes) == 0:
+        print("--- Comparativo de Consumo de Energia (Tabela) ---\n")
         print("Nenhum computador para comparar.")
         return
 
-    # Cabeçalho da tabela
-    print(f"{'Nome':<20} {'Potência (W)':<15} {'Consumo (kWh)':<15} {'Custo (R$)':<15}")
-    print("-" * 65)
-
-    # Dados de cada computador
-    for comp in computadores:
-        print(f"{comp['nome']:<20} {comp['potencia']:<15} {comp['consumo_kwh']:.2f}{'':<13} {comp['custo']:.2f}{'':<13}")
-    print("-" * 65)
-
-    # Encontrar o mais e menos eficiente
-    if len(computadores) > 1:
-        mais_economico = min(computadores, key=lambda x: x['custo'])
-        menos_economico = max(computadores, key=lambda x: x['custo'])
-        print(f"\nO computador mais econômico é: {mais_economico['nome']} (R${mais_economico['custo']:.2f}/mês)")
-        print(f"O computador menos econômico é: {menos_economico['nome']} (R${menos_economico['custo']:.2f}/mês)")
+    # Monta a tela inteira (título, cabeçalho, linhas e rodapé) em uma lista
+    # e escreve tudo em uma única chamada
+    separador = "-" * 65
+    partes = [
+        "--- Comparativo de Consumo de Energia (Tabela) ---\n",
+        _CABECALHO_TABELA('Nome', 'Potência (W)', 'Consumo (kWh)', 'Custo (R$)'),
+        separador,
+    ]
+    partes.extend(map(_formatador_linha(), nomes, potencias, consumos_kwh, custos))
+    partes.append(separador)
+
+    # Encontrar o mais e menos eficiente (reduções vetorizadas sobre o array de custos)
+    if len(nomes) > 1:
+        idx_min = int(np.argmin(custos))
+        idx_max = int(np.argmax(custos))
+        partes.append(f"\nO computador mais econômico é: {nomes[idx_min]} (R${custos[idx_min]:.2f}/mês)")
+        partes.append(f"O computador menos econômico é: {nomes[idx_max]} (R${custos[idx_max]:.2f}/mês)")
+
+    _out("\n".join(partes) + "\n")
     input("\nPressione Enter para continuar e ver o gráfico...") # Pausa para o usuário ler
 
-def gerar_grafico_comparacao(computadores):
+def gerar_grafico_comparacao(nomes, custos):
     """
     Gera um gráfico de barras comparando o custo mensal de cada computador.
     """
-    if not computadores:
+    if len(nomes) == 0:
         print("\nNão há dados de computadores para gerar o gráfico.")
         return
 
-    nomes = [comp['nome'] for comp in computadores]
-    custos = [comp['custo'] for comp in computadores]
+    # Sem display gráfico (ex.: CI ou acesso remoto), usa o backend Agg, que
+    # dispensa toda a inicialização de toolkit de janelas (Tk/Qt)
+    if not os.environ.get("DISPLAY") and os.name != "nt":
+        os.environ.setdefault("MPLBACKEND", "Agg")
+
+    # Import tardio: o matplotlib é pesado (~centenas de ms para carregar),
+    # então só pagamos esse custo se o gráfico realmente for gerado
+    import matplotlib.pyplot as plt
 
     limpa_tela() # Limpa a tela antes de mostrar o gráfico
 
-    plt.figure(figsize=(10, 6)) # Define o tamanho da figura (largura, altura)
-    plt.bar(nomes, custos, color='skyblue') # Cria o gráfico de barras
-    plt.xlabel('Nome do Computador') # Rótulo do eixo X
-    plt.ylabel('Custo Mensal (R$)') # Rótulo do eixo Y
-    plt.title('Comparativo de Custo Mensal de Energia por Computador') # Título do gráfico
-    plt.xticks(rotation=45, ha='right') # Rotaciona os rótulos do eixo X para melhor visualização
-    plt.grid(axis='y', linestyle='--', alpha=0.7) # Adiciona um grid no eixo Y
-    plt.tight_layout() # Ajusta o layout para evitar sobreposição de rótulos
-    plt.show() # Mostra o gráfico
+    # constrained_layout resolve o posicionamento durante o desenho, mais barato
+    # que o otimizador global pós-hoc do tight_layout
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True) # Cria figura e eixos de uma vez (largura, altura)
+    x = np.arange(len(nomes)) # Posições numéricas: evita o eixo categórico do matplotlib
+    ax.bar(x, custos, color='skyblue') # Cria o gráfico de barras em uma única chamada
+    ax.set_xlabel('Nome do Computador') # Rótulo do eixo X
+    ax.set_ylabel('Custo Mensal (R$)') # Rótulo do eixo Y
+    ax.set_title('Comparativo de Custo Mensal de Energia por Computador') # Título do gráfico
+    ax.set_xticks(x) # Uma marca por barra
+    ax.set_xticklabels(nomes, rotation=45, ha='right') # Rotaciona os rótulos do eixo X para melhor visualização
+    if len(nomes) > 3:
+        ax.grid(axis='y', linestyle='--', alpha=0.7) # Grid no eixo Y só quando há barras suficientes
+
+    if plt.get_backend().lower() == "agg":
+        # Backend sem janela: salva o gráfico em arquivo em vez de bloquear no show()
+        fig.savefig("comparativo.png", dpi=100)
+        print("\nGráfico salvo em comparativo.png")
+    else:
+        plt.show() # Mostra o gráfico
+
+def carregar_computadores_csv(caminho):
+    """
+    Carrega os computadores de um arquivo CSV com cabeçalho
+    nome,potencia,horas_por_dia,dias_por_mes, validando os intervalos de
+    todas as linhas de uma vez com comparações vetorizadas.
+
+    Args:
+        caminho (str): O caminho do arquivo CSV.
+
+    Returns:
+        tuple: Uma tupla contendo (nomes, potencias, horas, dias).
+
+    Raises:
+        ValueError: Se alguma coluna estiver fora do intervalo permitido.
+    """
+    dados = np.genfromtxt(caminho, delimiter=",", dtype=None, encoding="utf-8", names=True)
+    dados = np.atleast_1d(dados) # genfromtxt devolve um escalar para CSV de uma linha
+
+    nomes = [str(nome) for nome in dados['nome']]
+    potencias = dados['potencia']
+    horas = dados['horas_por_dia']
+    dias = dados['dias_por_mes']
+
+    # Valida nos dtypes largos lidos pelo genfromtxt, antes de estreitar:
+    # um cast prévio para int8 faria valores fora do intervalo darem a volta
+    # (ex.: 257 viraria 1) e passarem na validação
+    if not ((potencias >= 1) & (potencias <= 1000)).all():
+        raise ValueError("potência fora do intervalo de 1 a 1000 W")
+    if not ((horas >= 1) & (horas <= 24)).all():
+        raise ValueError("horas por dia fora do intervalo de 1 a 24")
+    if not ((dias >= 1) & (dias <= 30)).all():
+        raise ValueError("dias por mês fora do intervalo de 1 a 30")
+
+    return nomes, potencias.astype(np.int32), horas.astype(np.int8), dias.astype(np.int8)
 
 # --- Execução Principal ---
-if __name__ == "__main__":
+def _preaquecer_matplotlib():
+    """
+    Importa o matplotlib em segundo plano, para que o custo de carga
+    (varredura de fontes, seleção de backend) seja pago enquanto o usuário
+    ainda está digitando os dados, e não na hora de mostrar o gráfico.
+    """
+    if not os.environ.get("DISPLAY") and os.name != "nt":
+        os.environ.setdefault("MPLBACKEND", "Agg")
+    try:
+        import matplotlib.pyplot # noqa: F401 -- só aquece o cache do import
+    except Exception:
+        pass # Sem matplotlib disponível, o erro aparecerá no import tardio
+
+def _coletar_computadores_interativo():
+    """Executa o loop interativo de entrada e retorna os buffers paralelos."""
     limpa_tela()
     print("| CALCULADORA DE CONSUMO DE ENERGIA DO COMPUTADOR |\n")
 
-    computadores_registrados = [] # Lista para armazenar os dados de cada computador
+    # Buffers paralelos com os dados de cada computador (um valor por coluna).
+    # array.array guarda os números de forma compacta e contígua, sem criar
+    # um objeto Python por valor, e vira array NumPy sem cópia no final
+    nomes = []
+    potencias = array.array('i')
+    horas = array.array('b')
+    dias = array.array('b')
 
     while True:
-        print(f"\n--- Adicionando Computador #{len(computadores_registrados) + 1} ---")
+        print(f"\n--- Adicionando Computador #{len(nomes) + 1} ---")
 
         # Coleta e valida o nome do computador
         nome_computador = get_validated_string_input(
@@ -171,40 +350,64 @@ if __name__ == "__main__":
             "Quantos dias por mês o computador fica ligado (1 a 30 dias)?\n", 1, 30
         )
 
-        # Realiza o cálculo do consumo e custo
+        # Armazena as informações nos buffers paralelos
+        nomes.append(nome_computador)
+        potencias.append(potencia)
+        horas.append(horas_por_dia)
+        dias.append(dias_por_mes)
+
+        continuar = ""
+        while continuar not in _SIM_NAO:
+            continuar = input("\nDeseja adicionar outro computador? (s/n): ").strip().lower()
+            if continuar not in _SIM_NAO:
+                print("Resposta inválida. Por favor, digite 's' para sim ou 'n' para não.")
+        if continuar == 'n':
+            break
+
+    return nomes, potencias, horas, dias
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Calculadora de consumo de energia do computador."
+    )
+    parser.add_argument(
+        "--csv",
+        help="Arquivo CSV com as colunas nome,potencia,horas_por_dia,dias_por_mes "
+             "(pula o modo interativo e processa todas as linhas de uma vez)."
+    )
+    args = parser.parse_args()
+
+    if args.csv:
         try:
-            consumo_kwh, custo = calcular_consumo_mensal(
-                potencia, horas_por_dia, dias_por_mes, PRECO_KWH
-            )
-
-            # Armazena as informações em um dicionário
-            info_computador = {
-                "nome": nome_computador,
-                "potencia": potencia,
-                "horas_por_dia": horas_por_dia,
-                "dias_por_mes": dias_por_mes,
-                "consumo_kwh": consumo_kwh,
-                "custo": custo
-            }
-            computadores_registrados.append(info_computador)
-
-            while True:
-                continuar = input("\nDeseja adicionar outro computador? (s/n): ").lower()
-                if continuar in ['s', 'n']:
-                    break
-                else:
-                    print("Resposta inválida. Por favor, digite 's' para sim ou 'n' para não.")
-            if continuar == 'n':
-                break
-
-        except Exception as e:
-            print(f"\nOcorreu um erro inesperado ao calcular: {e}")
-            break # Sai do loop em caso de erro grave
+            nomes, potencias, horas, dias = carregar_computadores_csv(args.csv)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao ler o arquivo CSV: {e}")
+            sys.exit(1)
+    else:
+        # Aquece o matplotlib em paralelo com a digitação do usuário;
+        # opt-out via SIMULADOR_SEM_PREAQUECIMENTO=1
+        if not os.environ.get("SIMULADOR_SEM_PREAQUECIMENTO"):
+            threading.Thread(target=_preaquecer_matplotlib, daemon=True).start()
+        nomes, potencias, horas, dias = _coletar_computadores_interativo()
 
     # Exibe os resultados individuais, depois a comparação em tabela e, por fim, o gráfico
-    if computadores_registrados:
-        exibir_resultados_individuais(computadores_registrados)
-        exibir_comparacao_tabela(computadores_registrados)
-        gerar_grafico_comparacao(computadores_registrados)
+    if nomes:
+        # Calcula o consumo e o custo de todos os computadores de uma só vez.
+        # np.frombuffer enxerga os buffers coletados como arrays sem copiar.
+        # Os valores já chegam validados (get_int_input/carregar_computadores_csv),
+        # então a aritmética aqui não tem como falhar e dispensa try/except
+        potencias = np.frombuffer(potencias, dtype=np.int32)
+        consumos_kwh, custos = calcular_consumo_mensal(
+            potencias,
+            np.frombuffer(horas, dtype=np.int8),
+            np.frombuffer(dias, dtype=np.int8),
+            PRECO_KWH
+        )
+
+        exibir_resultados_individuais(nomes, potencias, consumos_kwh, custos)
+        exibir_comparacao_tabela(nomes, potencias, consumos_kwh, custos)
+        gerar_grafico_comparacao(nomes, custos)
     else:
         print("\nNenhum computador foi configurado. Encerrando o programa.")
\ No newline at end of file